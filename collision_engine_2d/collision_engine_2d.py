@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import math
-import cmath
 
 
 # GCD and LCM are not in math module.
@@ -91,24 +90,19 @@ class Point2D:
         theta: in radian
         center: a Point2D object
         """
+        cos_theta = math.cos(theta)
+        sin_theta = math.sin(theta)
         if center is None:
-            center = Point2D(0, 0)
-
-        # # transfer
-        # pt = self - center
-        # # rotate
-        # pt_rotated = Point2D(
-        #     int(math.cos(theta) * pt.x - math.sin(theta) * pt.y),
-        #     int(math.sin(theta) * pt.x + math.cos(theta) * pt.y)
-        # )
-        # # transfer back
-        # return pt_rotated + center
-
-        # Source: http://effbot.org/zone/tkinter-complex-canvas.htm
-        cangle = cmath.exp(theta * 1j)
-        offset = complex(center.x, center.y)
-        v = cangle * (complex(self.x, self.y) - offset) + offset
-        return Point2D(v.real, v.imag)
+            return Point2D(
+                cos_theta * self.x - sin_theta * self.y,
+                sin_theta * self.x + cos_theta * self.y,
+            )
+        x = self.x - center.x
+        y = self.y - center.y
+        return Point2D(
+            center.x + cos_theta * x - sin_theta * y,
+            center.y + sin_theta * x + cos_theta * y,
+        )
 
     def norm(self):
         return math.sqrt(self.x**2 + self.y**2)
@@ -292,21 +286,354 @@ class LineSegment2D(Line2D):
         return False
 
 
+class Transform2D:
+    """
+    Similarity transform in 2D: rotation, uniform scale, then translation
+
+    The transform maps a point p to scale * R(theta) * p + translation. It is
+    immutable, so its affine matrix is computed once and reused for every
+    point it is applied to.
+    """
+
+    def __init__(self, theta=0.0, translation=None, scale=1.0):
+        """Transform class constructor
+
+        Args:
+            theta (float): Rotation angle in radian.
+            translation (:obj:`Point2D`): Translation applied after rotation
+                and scaling. Defaults to Point2D(0, 0).
+            scale (float): Uniform scale factor. Must not be zero.
+
+        """
+        if scale == 0:
+            raise ValueError("Cannot use a zero scale in '{:s}'.".format(
+                type(self).__name__
+            ))
+        if translation is None:
+            translation = Point2D(0, 0)
+        self._theta = theta
+        self._translation = Point2D(translation.x, translation.y)
+        self._scale = scale
+        self._matrix = None
+
+    @classmethod
+    def identity(cls):
+        return cls()
+
+    @classmethod
+    def rotation(cls, theta, center=None):
+        """
+        theta: in radian
+        center: a Point2D object, the rotation is about the origin if None
+        """
+        if center is None:
+            return cls(theta)
+        # center + R * (p - center) = R * p + (center - R * center)
+        cos_theta = math.cos(theta)
+        sin_theta = math.sin(theta)
+        translation = Point2D(
+            center.x - (cos_theta * center.x - sin_theta * center.y),
+            center.y - (sin_theta * center.x + cos_theta * center.y),
+        )
+        transform = cls(theta, translation)
+        # Reuse the trig computed above instead of redoing it in `matrix`
+        transform._matrix = (
+            cos_theta, -sin_theta, sin_theta, cos_theta,
+            translation.x, translation.y,
+        )
+        return transform
+
+    @classmethod
+    def translation_by(cls, offset):
+        return cls(0.0, offset)
+
+    @property
+    def theta(self):
+        return self._theta
+
+    @property
+    def translation(self):
+        return Point2D(self._translation.x, self._translation.y)
+
+    @property
+    def scale(self):
+        return self._scale
+
+    @property
+    def matrix(self):
+        """Affine matrix as a tuple (a, b, c, d, tx, ty)
+
+        Maps (x, y) to (a*x + b*y + tx, c*x + d*y + ty).
+        """
+        if self._matrix is None:
+            cos_theta = self._scale * math.cos(self._theta)
+            sin_theta = self._scale * math.sin(self._theta)
+            self._matrix = (
+                cos_theta,
+                -sin_theta,
+                sin_theta,
+                cos_theta,
+                self._translation.x,
+                self._translation.y,
+            )
+        return self._matrix
+
+    def __eq__(self, other):
+        if type(other) is Transform2D:
+            if (
+                self._theta == other._theta
+                and self._translation == other._translation
+                and self._scale == other._scale
+            ):
+                return True
+        return False
+
+    def __str__(self):
+        return "Transform2D(theta=%f, translation=%s, scale=%f)" % (
+            self._theta, self._translation, self._scale
+        )
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __matmul__(self, other):
+        return self.compose(other)
+
+    def compose(self, other):
+        """Transform applying `other` first and then `self`"""
+        if type(other) is not Transform2D:
+            raise TypeError(
+                "Cannot compose '{:s}' with '{:}'".format(
+                    type(self).__name__, type(other).__name__
+                )
+            )
+        return Transform2D(
+            self._theta + other._theta,
+            self.apply(other._translation),
+            self._scale * other._scale,
+        )
+
+    def inverse(self):
+        inverse_scale = 1.0 / self._scale
+        cos_theta = math.cos(self._theta) * inverse_scale
+        sin_theta = math.sin(self._theta) * inverse_scale
+        tx, ty = self._translation.x, self._translation.y
+        # -(1/s) * R(-theta) * translation
+        return Transform2D(
+            -self._theta,
+            Point2D(
+                -(cos_theta * tx + sin_theta * ty),
+                -(-sin_theta * tx + cos_theta * ty),
+            ),
+            inverse_scale,
+        )
+
+    def apply(self, point):
+        a, b, c, d, tx, ty = self.matrix
+        x, y = point.x, point.y
+        return Point2D(a * x + b * y + tx, c * x + d * y + ty)
+
+    def apply_to_points(self, points):
+        """Transform a whole vertex list in one pass
+
+        Args:
+            points (:obj:`list`): A list of :obj:`Point2D`.
+
+        Returns:
+            :obj:`list`: The transformed points, in the same order.
+
+        """
+        a, b, c, d, tx, ty = self.matrix
+        return [
+            Point2D(a * p.x + b * p.y + tx, c * p.x + d * p.y + ty)
+            for p in points
+        ]
+
+
 class GeometricObject:
     """Object representation in 2D"""
 
-    def __init__(self, vertex, edges):
+    def __init__(self, vertex, edges, transform=None):
         """Object class constructor
 
         Args:
-            vertex (:obj:`list`): A list of vertexes. Each vertex is  a :obj:`Point2D`.
+            vertex (:obj:`list`): A list of vertexes. Each vertex is  a :obj:`Point2D`
+                in the object's local space.
             edges (:obj:`list`): A list of vertex index pair. The vertex index in
                 argument vertex.
+            transform (:obj:`Transform2D`): Local to world transform. Defaults
+                to the identity transform.
 
         """
-        self.vertex = vertex
+        self._vertex = vertex
         self.edges = edges
         self.movement = Point2D(0, 0)
+        if transform is None:
+            transform = Transform2D.identity()
+        self._transform = transform
+        self._world_vertex = None
+
+    @property
+    def vertex(self):
+        return self._vertex
+
+    @vertex.setter
+    def vertex(self, vertex):
+        self._vertex = vertex
+        self._world_vertex = None
+
+    @property
+    def transform(self):
+        return self._transform
+
+    @transform.setter
+    def transform(self, transform):
+        if transform is not self._transform:
+            self._transform = transform
+            self._world_vertex = None
+
+    @property
+    def world_vertex(self):
+        """Vertexes in world space, recomputed only when the vertexes or the
+        transform are replaced"""
+        if self._world_vertex is None:
+            self._world_vertex = self._transform.apply_to_points(self._vertex)
+        return self._world_vertex
+
+    def apply_transform(self, transform):
+        """Apply `transform` on top of the current transform"""
+        self.transform = transform.compose(self._transform)
+
+    def invalidate_world_vertex(self):
+        """Drop cached world vertexes after editing `vertex` in place"""
+        self._world_vertex = None
+
+
+def _sweep_point_segment(ox, oy, dx, dy, c1x, c1y, c2x, c2y):
+    """Earliest contact of point o moving by d against static segment c1-c2
+
+    Returns a (s, u) pair where s in [0, 1] is the fraction of the movement
+    and u in [0, 1] is the contact position along the segment, or None.
+    """
+    ex = c2x - c1x
+    ey = c2y - c1y
+    wx = c1x - ox
+    wy = c1y - oy
+    ee = ex * ex + ey * ey
+    if ee == 0:
+        # Zero length segment, sweep the point against a point
+        dd = dx * dx + dy * dy
+        if dd == 0:
+            if wx == 0 and wy == 0:
+                return 0.0, 0.0
+            return None
+        if abs(wx * dy - wy * dx) > 1e-10 * dd:
+            return None
+        s = (wx * dx + wy * dy) / dd
+        if -1e-10 <= s <= 1 + 1e-10:
+            return min(max(s, 0.0), 1.0), 0.0
+        return None
+
+    denom = dx * ey - dy * ex
+    if abs(denom) > 1e-10 * math.hypot(dx, dy) * math.hypot(ex, ey):
+        s = (wx * ey - wy * ex) / denom
+        u = (wx * dy - wy * dx) / denom
+        if -1e-10 <= s <= 1 + 1e-10 and -1e-10 <= u <= 1 + 1e-10:
+            return min(max(s, 0.0), 1.0), min(max(u, 0.0), 1.0)
+        return None
+
+    # Movement is parallel to the segment (or there is no movement)
+    if abs(wx * ey - wy * ex) > 1e-10 * ee:
+        return None
+    u0 = -(wx * ex + wy * ey) / ee
+    if -1e-10 <= u0 <= 1 + 1e-10:
+        return 0.0, min(max(u0, 0.0), 1.0)
+    du = (dx * ex + dy * ey) / ee
+    if du == 0:
+        return None
+    target = 0.0 if u0 < 0 else 1.0
+    s = (target - u0) / du
+    if -1e-10 <= s <= 1 + 1e-10:
+        return max(s, 0.0), target
+    return None
+
+
+def _segment_feature(u):
+    if u <= 1e-10:
+        return "point1"
+    if u >= 1 - 1e-10:
+        return "point2"
+    return "edge"
+
+
+def _edge_edge_sweep(
+    p1x, p1y, p2x, p2y, vax, vay, q1x, q1y, q2x, q2y, vbx, vby
+):
+    """Earliest contact of segment p1-p2 moving by va and q1-q2 moving by vb
+
+    Returns (time, x, y, feature_a, feature_b) or None.
+    """
+    # Segments already crossing at the start of the movement
+    eax = p2x - p1x
+    eay = p2y - p1y
+    ebx = q2x - q1x
+    eby = q2y - q1y
+    o1 = eax * (q1y - p1y) - eay * (q1x - p1x)
+    o2 = eax * (q2y - p1y) - eay * (q2x - p1x)
+    o3 = ebx * (p1y - q1y) - eby * (p1x - q1x)
+    o4 = ebx * (p2y - q1y) - eby * (p2x - q1x)
+    if o1 * o2 < 0 and o3 * o4 < 0:
+        r = o3 / (o3 - o4)
+        return 0.0, p1x + eax * r, p1y + eay * r, "edge", "edge"
+
+    # Relative motion of segment a with segment b held still
+    dx = vax - vbx
+    dy = vay - vby
+    best = None
+    for name, ox, oy in (("point1", p1x, p1y), ("point2", p2x, p2y)):
+        hit = _sweep_point_segment(ox, oy, dx, dy, q1x, q1y, q2x, q2y)
+        if hit is not None and (best is None or hit[0] < best[0]):
+            s = hit[0]
+            best = (s, ox + vax * s, oy + vay * s, name, _segment_feature(hit[1]))
+    for name, ox, oy in (("point1", q1x, q1y), ("point2", q2x, q2y)):
+        hit = _sweep_point_segment(ox, oy, -dx, -dy, p1x, p1y, p2x, p2y)
+        if hit is not None and (best is None or hit[0] < best[0]):
+            s = hit[0]
+            best = (s, ox + vbx * s, oy + vby * s, _segment_feature(hit[1]), name)
+    return best
+
+
+class SweptContact2D:
+    """Earliest contact between two moving edges
+
+    Attributes:
+        time (float): Fraction of the movement, in [0, 1], at which the edges
+            first touch.
+        point (:obj:`Point2D`): Contact position at that time.
+        feature_a (str): Feature of the first edge that made the contact,
+            "point1", "point2" or "edge".
+        feature_b (str): Feature of the second edge that made the contact.
+        edge_a (int): Index of the first edge in its object, if any.
+        edge_b (int): Index of the second edge in its object, if any.
+    """
+
+    def __init__(
+        self, time, point, feature_a, feature_b, edge_a=None, edge_b=None
+    ):
+        self.time = time
+        self.point = point
+        self.feature_a = feature_a
+        self.feature_b = feature_b
+        self.edge_a = edge_a
+        self.edge_b = edge_b
+
+    def __str__(self):
+        return "SweptContact2D(time=%f, point=%s, features=(%s, %s))" % (
+            self.time, self.point, self.feature_a, self.feature_b
+        )
+
+    def __repr__(self):
+        return self.__str__()
 
 
 class CollisionEngine2D:
@@ -334,6 +661,88 @@ class CollisionEngine2D:
             return True
         return False
 
+    @staticmethod
+    def edge_edge_collision(
+        line_segment_a, line_segment_a_movement,
+        line_segment_b, line_segment_b_movement
+    ):
+        """Swept collision between two translating line segments
+
+        Both segments move linearly over the same time step. Every vertex
+        against edge and vertex against vertex case is solved in one pass on
+        their relative motion.
+
+        Args:
+            line_segment_a (:obj:`LineSegment2D`): First segment.
+            line_segment_a_movement (:obj:`Point2D`): Movement of the first
+                segment over the time step.
+            line_segment_b (:obj:`LineSegment2D`): Second segment.
+            line_segment_b_movement (:obj:`Point2D`): Movement of the second
+                segment over the time step.
+
+        Returns:
+            :obj:`SweptContact2D` of the earliest contact, or False if the
+            segments never touch.
+
+        """
+        a1, a2 = line_segment_a.point1, line_segment_a.point2
+        b1, b2 = line_segment_b.point1, line_segment_b.point2
+        hit = _edge_edge_sweep(
+            a1.x, a1.y, a2.x, a2.y,
+            line_segment_a_movement.x, line_segment_a_movement.y,
+            b1.x, b1.y, b2.x, b2.y,
+            line_segment_b_movement.x, line_segment_b_movement.y,
+        )
+        if hit is None:
+            return False
+        time, x, y, feature_a, feature_b = hit
+        return SweptContact2D(time, Point2D(x, y), feature_a, feature_b)
+
+    @staticmethod
+    def object_collision(object_a, object_b):
+        """Earliest swept contact between the edges of two objects
+
+        Uses the world space vertexes and the movement of each object.
+
+        Returns:
+            :obj:`SweptContact2D` with `edge_a` and `edge_b` set to the edge
+            indexes that touched first, or False if the objects never touch.
+
+        """
+        vertex_a = object_a.world_vertex
+        vertex_b = object_b.world_vertex
+        vax, vay = object_a.movement.x, object_a.movement.y
+        vbx, vby = object_b.movement.x, object_b.movement.y
+        edges_b = [
+            (vertex_b[i].x, vertex_b[i].y, vertex_b[j].x, vertex_b[j].y)
+            for i, j in object_b.edges
+        ]
+
+        best = None
+        best_edges = None
+        for edge_a, (i, j) in enumerate(object_a.edges):
+            p1x, p1y = vertex_a[i].x, vertex_a[i].y
+            p2x, p2y = vertex_a[j].x, vertex_a[j].y
+            for edge_b, (q1x, q1y, q2x, q2y) in enumerate(edges_b):
+                hit = _edge_edge_sweep(
+                    p1x, p1y, p2x, p2y, vax, vay,
+                    q1x, q1y, q2x, q2y, vbx, vby,
+                )
+                if hit is not None and (best is None or hit[0] < best[0]):
+                    best = hit
+                    best_edges = (edge_a, edge_b)
+                    if hit[0] == 0:
+                        break
+            if best is not None and best[0] == 0:
+                break
+
+        if best is None:
+            return False
+        time, x, y, feature_a, feature_b = best
+        return SweptContact2D(
+            time, Point2D(x, y), feature_a, feature_b, *best_edges
+        )
+
 
 # if __name__ == "__main__":
 #     point = Point2D(0, 0)
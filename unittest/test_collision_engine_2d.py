@@ -74,6 +74,18 @@ class TestPoint2D(unittest.TestCase):
             Point2D(-10, -100)
         )
 
+    def assertPointAlmostEqual(self, point_a, point_b):
+        self.assertAlmostEqual(point_a.x, point_b.x)
+        self.assertAlmostEqual(point_a.y, point_b.y)
+
+    def test_point2d_rotate(self):
+        self.assertPointAlmostEqual(
+            Point2D(1, 0).rotate(math.pi / 2), Point2D(0, 1)
+        )
+        self.assertPointAlmostEqual(
+            Point2D(3, 2).rotate(math.pi / 2, Point2D(2, 2)), Point2D(2, 3)
+        )
+
     def test_point2d_find_distance(self):
         self.assertEqual(
             self.point_a.find_distance(self.point_b), math.sqrt(50)
@@ -162,6 +174,94 @@ class TestLineSegment2D(unittest.TestCase):
 
 
 
+class TestTransform2D(unittest.TestCase):
+    def assertPointAlmostEqual(self, point_a, point_b):
+        self.assertAlmostEqual(point_a.x, point_b.x)
+        self.assertAlmostEqual(point_a.y, point_b.y)
+
+    def test_transform2d_declearation(self):
+        with self.assertRaises(ValueError):
+            Transform2D(0, Point2D(1, 2), 0)
+        self.assertEqual(Transform2D(), Transform2D.identity())
+
+    def test_transform2d_apply(self):
+        transform = Transform2D(math.pi / 2, Point2D(10, 0), 2)
+        self.assertPointAlmostEqual(
+            transform.apply(Point2D(1, 0)), Point2D(10, 2)
+        )
+        self.assertPointAlmostEqual(
+            Transform2D.rotation(math.pi, Point2D(1, 1)).apply(Point2D(2, 1)),
+            Point2D(0, 1)
+        )
+
+    def test_transform2d_apply_to_points(self):
+        transform = Transform2D(0.3, Point2D(-4, 7), 1.5)
+        points = [Point2D(1, 2), Point2D(-3, 5), Point2D(0, 0)]
+        transformed = transform.apply_to_points(points)
+        self.assertEqual(len(transformed), len(points))
+        for point, transformed_point in zip(points, transformed):
+            self.assertPointAlmostEqual(
+                transformed_point, transform.apply(point)
+            )
+
+    def test_transform2d_compose(self):
+        first = Transform2D(0.4, Point2D(3, -1), 2)
+        second = Transform2D(-1.1, Point2D(0.5, 8), 0.5)
+        point = Point2D(6, -2)
+        self.assertPointAlmostEqual(
+            (second @ first).apply(point), second.apply(first.apply(point))
+        )
+        with self.assertRaises(TypeError):
+            first.compose(Point2D(0, 0))
+
+    def test_transform2d_inverse(self):
+        transform = Transform2D(2.2, Point2D(-5, 9), 3)
+        point = Point2D(4, 1)
+        self.assertPointAlmostEqual(
+            transform.inverse().apply(transform.apply(point)), point
+        )
+
+
+class TestGeometricObject(unittest.TestCase):
+    def test_geometric_object_world_vertex(self):
+        geometric_object = GeometricObject(
+            [Point2D(0, 0), Point2D(1, 0), Point2D(1, 1)],
+            [(0, 1), (1, 2), (2, 0)]
+        )
+        self.assertEqual(geometric_object.world_vertex, geometric_object.vertex)
+
+        world_vertex = geometric_object.world_vertex
+        self.assertIs(geometric_object.world_vertex, world_vertex)
+
+        geometric_object.apply_transform(Transform2D.translation_by(Point2D(5, 5)))
+        self.assertIsNot(geometric_object.world_vertex, world_vertex)
+        self.assertEqual(
+            geometric_object.world_vertex,
+            [Point2D(5, 5), Point2D(6, 5), Point2D(6, 6)]
+        )
+
+        # Setting the same transform object keeps the cache
+        world_vertex = geometric_object.world_vertex
+        geometric_object.transform = geometric_object.transform
+        self.assertIs(geometric_object.world_vertex, world_vertex)
+
+        # Reassigning the vertexes drops the cache
+        geometric_object.vertex = [Point2D(2, 0), Point2D(2, 2)]
+        self.assertEqual(
+            geometric_object.world_vertex, [Point2D(7, 5), Point2D(7, 7)]
+        )
+
+        # Editing the vertexes in place needs an explicit invalidation
+        geometric_object.vertex[0] = Point2D(0, 0)
+        self.assertEqual(
+            geometric_object.world_vertex, [Point2D(7, 5), Point2D(7, 7)]
+        )
+        geometric_object.invalidate_world_vertex()
+        self.assertEqual(
+            geometric_object.world_vertex, [Point2D(5, 5), Point2D(7, 7)]
+        )
+
+
 class TestCollisionEngine2D(unittest.TestCase):
     # def setUp(self):
 
@@ -279,6 +379,95 @@ class TestCollisionEngine2D(unittest.TestCase):
             )
         )
 
+    def test_collision_engine2d_edge_edge_collision(self):
+        # Vertex of the first segment hits the middle of the second one
+        contact = CollisionEngine2D.edge_edge_collision(
+            LineSegment2D(Point2D(0, 0), Point2D(0, -10)), Point2D(10, 0),
+            LineSegment2D(Point2D(5, -20), Point2D(5, 20)), Point2D(0, 0)
+        )
+        self.assertAlmostEqual(contact.time, 0.5)
+        self.assertEqual(contact.point, Point2D(5, 0))
+        self.assertEqual((contact.feature_a, contact.feature_b), ("point1", "edge"))
+
+        # Vertex of the second segment hits the first one, both moving
+        contact = CollisionEngine2D.edge_edge_collision(
+            LineSegment2D(Point2D(-5, 0), Point2D(5, 0)), Point2D(0, 2),
+            LineSegment2D(Point2D(0, 4), Point2D(0, 10)), Point2D(0, -2)
+        )
+        self.assertAlmostEqual(contact.time, 1.0)
+        self.assertEqual((contact.feature_a, contact.feature_b), ("edge", "point1"))
+        self.assertAlmostEqual(contact.point.y, 2)
+
+        # Endpoint on endpoint
+        contact = CollisionEngine2D.edge_edge_collision(
+            LineSegment2D(Point2D(0, 0), Point2D(-4, -4)), Point2D(4, 4),
+            LineSegment2D(Point2D(2, 2), Point2D(2, 8)), Point2D(0, 0)
+        )
+        self.assertAlmostEqual(contact.time, 0.5)
+        self.assertEqual((contact.feature_a, contact.feature_b), ("point1", "point1"))
+
+        # Collinear segments sliding into each other
+        contact = CollisionEngine2D.edge_edge_collision(
+            LineSegment2D(Point2D(0, 0), Point2D(2, 0)), Point2D(4, 0),
+            LineSegment2D(Point2D(5, 0), Point2D(9, 0)), Point2D(-2, 0)
+        )
+        self.assertAlmostEqual(contact.time, 0.5)
+        self.assertEqual((contact.feature_a, contact.feature_b), ("point2", "point1"))
+
+        # Already crossing
+        contact = CollisionEngine2D.edge_edge_collision(
+            LineSegment2D(Point2D(-1, 0), Point2D(1, 0)), Point2D(0, 0),
+            LineSegment2D(Point2D(0, -1), Point2D(0, 1)), Point2D(0, 0)
+        )
+        self.assertEqual(contact.time, 0)
+        self.assertEqual((contact.feature_a, contact.feature_b), ("edge", "edge"))
+
+        # Missing each other
+        self.assertFalse(
+            CollisionEngine2D.edge_edge_collision(
+                LineSegment2D(Point2D(0, 0), Point2D(1, 0)), Point2D(0, 1),
+                LineSegment2D(Point2D(5, 0), Point2D(5, 5)), Point2D(0, 0)
+            )
+        )
+
+    def test_collision_engine2d_object_collision(self):
+        square = [Point2D(0, 0), Point2D(1, 0), Point2D(1, 1), Point2D(0, 1)]
+        square_edges = [(0, 1), (1, 2), (2, 3), (3, 0)]
+        object_a = GeometricObject(square, square_edges)
+        object_b = GeometricObject(
+            square, square_edges, Transform2D.translation_by(Point2D(3, 0))
+        )
+        object_a.movement = Point2D(4, 0)
+
+        contact = CollisionEngine2D.object_collision(object_a, object_b)
+        self.assertAlmostEqual(contact.time, 0.5)
+        self.assertAlmostEqual(contact.point.x, 3)
+        # Contact is made along the right side of a and the left side of b
+        self.assertIn(1, square_edges[contact.edge_a])
+        self.assertIn(0, square_edges[contact.edge_b])
+
+        object_a.movement = Point2D(0, 4)
+        self.assertFalse(CollisionEngine2D.object_collision(object_a, object_b))
+
+        # Zero length edges are swept as points
+        object_c = GeometricObject([Point2D(2, 0.5), Point2D(2, 0.5)], [(0, 1)])
+        object_a.movement = Point2D(4, 0)
+        contact = CollisionEngine2D.object_collision(object_a, object_c)
+        self.assertAlmostEqual(contact.time, 0.25)
+        self.assertEqual(contact.feature_b, "point1")
+
+        object_d = GeometricObject([Point2D(0, 3), Point2D(0, 3)], [(0, 1)])
+        object_d.movement = Point2D(0, 2)
+        contact = CollisionEngine2D.object_collision(object_c, object_d)
+        self.assertFalse(contact)
+        object_d.movement = Point2D(4, -5)
+        contact = CollisionEngine2D.object_collision(object_c, object_d)
+        self.assertAlmostEqual(contact.time, 0.5)
+        self.assertEqual(contact.point, Point2D(2, 0.5))
+        self.assertEqual(
+            (contact.feature_a, contact.feature_b), ("point1", "point1")
+        )
+
 
 def args_config(args_parser):
     args_parser.add_argument('-d', '--show-details', required=False, action='store_true', help='Show details of testing.')
@@ -309,6 +498,10 @@ if __name__ == "__main__":
     suite_line_segment2d = unittest.TestLoader().loadTestsFromTestCase(
         TestLineSegment2D
     )
+    suite_transform2d = unittest.TestLoader().loadTestsFromTestCase(TestTransform2D)
+    suite_geometric_object = unittest.TestLoader().loadTestsFromTestCase(
+        TestGeometricObject
+    )
     suite_collision_engine2d = unittest.TestLoader().loadTestsFromTestCase(
         TestCollisionEngine2D
     )
@@ -317,6 +510,8 @@ if __name__ == "__main__":
         suite_point2d,
         suite_line2d,
         suite_line_segment2d,
+        suite_transform2d,
+        suite_geometric_object,
         suite_collision_engine2d,
         ])
 